@@ -32,6 +32,9 @@ setup(
     install_requires=[
         "requests>=2.28.0",
     ],
+    extras_require={
+        "fast": ["orjson>=3.6"],
+    },
     entry_points={
         "console_scripts": [
             "tumblr-media-downloader=tumblr_downloader.cli:main",
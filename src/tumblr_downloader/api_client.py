@@ -26,6 +26,9 @@ from urllib3.util.retry import Retry
 
 logger = logging.getLogger('tumblr_downloader')
 
+# Tumblr v1 API wraps its response in: var tumblr_api_read = {...};
+_JSONP_RE = re.compile(r'var tumblr_api_read\s*=\s*({.*?});?\s*$', re.DOTALL)
+
 
 class TumblrAPIError(Exception):
     """Base exception for Tumblr API related errors."""
@@ -54,7 +57,7 @@ class TumblrAPIClient:
     Attributes:
         blog_name: The name of the Tumblr blog to fetch posts from
         base_url: The base API URL for the blog
-        session: Configured requests session with retry logic
+        session: Requests session with retry logic mounted for the blog's API
         
     Example:
         >>> client = TumblrAPIClient("staff")
@@ -63,19 +66,25 @@ class TumblrAPIClient:
     """
     
     # API configuration
-    API_ENDPOINT = "https://{blog_name}.tumblr.com/api/read/json"
+    API_ORIGIN = "https://{blog_name}.tumblr.com/"
+    API_ENDPOINT = API_ORIGIN + "api/read/json"
     POSTS_PER_PAGE = 50  # Maximum posts per request
     MAX_RETRIES = 5
     INITIAL_BACKOFF = 1.0  # Initial backoff in seconds
     MAX_BACKOFF = 60.0  # Maximum backoff in seconds
     REQUEST_TIMEOUT = 30  # Request timeout in seconds
+    HEADERS = {'User-Agent': 'TumblrMediaDownloader/1.0'}
+    RETRY_STATUS_CODES = frozenset({500, 502, 503, 504})  # Retried by the adapter
     
-    def __init__(self, blog_name: str) -> None:
+    def __init__(self, blog_name: str, session: Optional[requests.Session] = None) -> None:
         """
         Initialize the Tumblr API client.
         
         Args:
             blog_name: The name of the Tumblr blog (without .tumblr.com)
+            session: Optional session to share with other clients (e.g. the
+                media downloader) so they share one connection pool. The
+                caller remains responsible for closing it.
             
         Raises:
             ValueError: If blog_name is empty or invalid
@@ -87,35 +96,38 @@ class TumblrAPIClient:
         self.base_url = self.API_ENDPOINT.format(blog_name=self.blog_name)
         
         # Configure session with connection pooling and retry logic
-        self.session = self._create_session()
+        self._owns_session = session is None
+        self.session = self._create_session(session)
         
-        logger.info(f"Initialized TumblrAPIClient for blog: {self.blog_name}")
+        logger.info("Initialized TumblrAPIClient for blog: %s", self.blog_name)
     
-    def _create_session(self) -> requests.Session:
+    def _create_session(self, session: Optional[requests.Session] = None) -> requests.Session:
         """
-        Create a configured requests session with retry logic.
+        Create or configure a requests session with retry logic.
+        
+        The retry adapter is mounted only for this blog's API origin, so a
+        shared session keeps its own adapters for other hosts.
+        
+        Args:
+            session: Existing session to configure; a new one is created
+                if None
         
         Returns:
             Configured requests.Session instance
         """
-        session = requests.Session()
+        if session is None:
+            session = requests.Session()
         
         # Configure retry strategy for transient failures
         retry_strategy = Retry(
             total=3,
             backoff_factor=0.5,
-            status_forcelist=[500, 502, 503, 504],
+            status_forcelist=self.RETRY_STATUS_CODES,
             allowed_methods=["GET"]
         )
         
         adapter = HTTPAdapter(max_retries=retry_strategy)
-        session.mount("http://", adapter)
-        session.mount("https://", adapter)
-        
-        # Set a user agent to identify our client
-        session.headers.update({
-            'User-Agent': 'TumblrMediaDownloader/1.0'
-        })
+        session.mount(self.API_ORIGIN.format(blog_name=self.blog_name), adapter)
         
         return session
     
@@ -135,9 +147,7 @@ class TumblrAPIClient:
         Raises:
             TumblrAPIError: If response format is invalid
         """
-        # Tumblr v1 API wraps response in: var tumblr_api_read = {...};
-        match = re.search(r'var tumblr_api_read\s*=\s*({.*?});?\s*$', 
-                         response_text, re.DOTALL)
+        match = _JSONP_RE.search(response_text)
         
         if not match:
             logger.error("Failed to parse JSONP response format")
@@ -172,22 +182,23 @@ class TumblrAPIClient:
         
         while attempt < self.MAX_RETRIES:
             try:
-                logger.debug(f"Making request to {url} (attempt {attempt + 1}/{self.MAX_RETRIES})")
+                logger.debug("Making request to %s (attempt %d/%d)", url, attempt + 1, self.MAX_RETRIES)
                 
                 response = self.session.get(
                     url,
                     params=params,
+                    headers=self.HEADERS,  # Identify our client
                     timeout=self.REQUEST_TIMEOUT
                 )
                 
                 # Handle HTTP errors
                 if response.status_code == 404:
-                    logger.error(f"Blog not found: {self.blog_name}")
+                    logger.error("Blog not found: %s", self.blog_name)
                     raise BlogNotFoundError(f"Blog '{self.blog_name}' not found")
                 
                 if response.status_code == 429:
                     # Rate limit exceeded
-                    logger.warning(f"Rate limit exceeded, backing off for {backoff}s")
+                    logger.warning("Rate limit exceeded, backing off for %ss", backoff)
                     time.sleep(backoff)
                     backoff = min(backoff * 2, self.MAX_BACKOFF)
                     attempt += 1
@@ -200,15 +211,15 @@ class TumblrAPIClient:
                 json_str = self._strip_jsonp_callback(response.text)
                 data = json.loads(json_str)
                 
-                logger.debug(f"Successfully fetched data from {url}")
+                logger.debug("Successfully fetched data from %s", url)
                 return data
                 
             except (Timeout, ConnectionError) as e:
-                logger.warning(f"Network error on attempt {attempt + 1}: {e}")
+                logger.warning("Network error on attempt %d: %s", attempt + 1, e)
                 attempt += 1
                 
                 if attempt >= self.MAX_RETRIES:
-                    logger.error(f"Max retries exceeded for {url}")
+                    logger.error("Max retries exceeded for %s", url)
                     raise TumblrAPIError(f"Failed to connect after {self.MAX_RETRIES} attempts") from e
                 
                 # Exponential backoff for network errors
@@ -218,7 +229,7 @@ class TumblrAPIClient:
             except HTTPError as e:
                 if e.response.status_code >= 500:
                     # Server error, retry with backoff
-                    logger.warning(f"Server error {e.response.status_code}, retrying...")
+                    logger.warning("Server error %d, retrying...", e.response.status_code)
                     attempt += 1
                     
                     if attempt >= self.MAX_RETRIES:
@@ -228,21 +239,21 @@ class TumblrAPIClient:
                     backoff = min(backoff * 2, self.MAX_BACKOFF)
                 else:
                     # Client error, don't retry
-                    logger.error(f"HTTP error {e.response.status_code}: {e}")
+                    logger.error("HTTP error %d: %s", e.response.status_code, e)
                     raise TumblrAPIError(f"HTTP error: {e}") from e
                     
             except json.JSONDecodeError as e:
-                logger.error(f"Failed to parse JSON response: {e}")
+                logger.error("Failed to parse JSON response: %s", e)
                 raise TumblrAPIError("Invalid JSON in API response") from e
                 
             except Exception as e:
-                logger.error(f"Unexpected error during API request: {e}")
+                logger.error("Unexpected error during API request: %s", e)
                 raise TumblrAPIError(f"Unexpected error: {e}") from e
         
         # If we've exhausted all retries
         raise RateLimitError(f"Rate limit exceeded after {self.MAX_RETRIES} attempts")
     
-    def get_posts(self, limit: Optional[int] = None) -> Iterator[dict]:
+    def get_posts(self, limit: Optional[int] = None, start: int = 0) -> Iterator[dict]:
         """
         Generator that paginates through all blog posts.
         
@@ -252,6 +263,8 @@ class TumblrAPIClient:
         
         Args:
             limit: Maximum number of posts to fetch. If None, fetch all posts.
+            start: Offset of the first post to fetch, used to resume an
+                interrupted download (default: 0).
             
         Yields:
             dict: Individual post objects from the blog
@@ -266,18 +279,20 @@ class TumblrAPIClient:
             >>> for post in client.get_posts(limit=10):
             ...     print(f"Post ID: {post['id']}, Type: {post['type']}")
         """
-        start = 0
+        if start < 0:
+            raise ValueError("start must not be negative")
+        
         total_fetched = 0
         total_posts = None
         
-        logger.info(f"Starting to fetch posts from blog: {self.blog_name}")
+        logger.info("Starting to fetch posts from blog: %s (offset %d)", self.blog_name, start)
         
         while True:
             # Determine how many posts to fetch in this batch
             if limit is not None:
                 remaining = limit - total_fetched
                 if remaining <= 0:
-                    logger.info(f"Reached limit of {limit} posts")
+                    logger.info("Reached limit of %d posts", limit)
                     break
                 num_to_fetch = min(self.POSTS_PER_PAGE, remaining)
             else:
@@ -289,7 +304,7 @@ class TumblrAPIClient:
                 'num': num_to_fetch
             }
             
-            logger.debug(f"Fetching posts {start} to {start + num_to_fetch}")
+            logger.debug("Fetching posts %d to %d", start, start + num_to_fetch)
             
             try:
                 data = self._make_request(self.base_url, params)
@@ -297,13 +312,13 @@ class TumblrAPIClient:
                 # Re-raise API errors
                 raise
             except Exception as e:
-                logger.error(f"Unexpected error fetching posts: {e}")
+                logger.error("Unexpected error fetching posts: %s", e)
                 raise TumblrAPIError(f"Failed to fetch posts: {e}") from e
             
             # Extract metadata on first request
             if total_posts is None:
                 total_posts = data.get('posts-total', 0)
-                logger.info(f"Blog has {total_posts} total posts")
+                logger.info("Blog has %s total posts", total_posts)
             
             # Get posts from response
             posts = data.get('posts', [])
@@ -318,7 +333,7 @@ class TumblrAPIClient:
                 total_fetched += 1
                 
                 if limit is not None and total_fetched >= limit:
-                    logger.info(f"Reached limit of {limit} posts")
+                    logger.info("Reached limit of %d posts", limit)
                     return
             
             # Update start position for next page
@@ -326,13 +341,13 @@ class TumblrAPIClient:
             
             # Check if we've fetched all available posts
             if start >= total_posts:
-                logger.info(f"Fetched all {total_fetched} posts from blog")
+                logger.info("Fetched all %d posts from blog", total_fetched)
                 break
             
             # Small delay between requests to be respectful
             time.sleep(0.5)
         
-        logger.info(f"Finished fetching {total_fetched} posts from {self.blog_name}")
+        logger.info("Finished fetching %d posts from %s", total_fetched, self.blog_name)
     
     def get_blog_info(self) -> dict:
         """
@@ -345,7 +360,7 @@ class TumblrAPIClient:
             BlogNotFoundError: If the blog doesn't exist
             TumblrAPIError: For other API-related errors
         """
-        logger.debug(f"Fetching blog info for {self.blog_name}")
+        logger.debug("Fetching blog info for %s", self.blog_name)
         
         data = self._make_request(self.base_url, params={'num': 0})
         
@@ -359,7 +374,7 @@ class TumblrAPIClient:
             'timezone': data.get('tumblelog', {}).get('timezone', 'US/Eastern'),
         }
         
-        logger.info(f"Retrieved blog info for '{blog_info['title']}' ({blog_info['posts_total']} posts)")
+        logger.info("Retrieved blog info for '%s' (%s posts)", blog_info['title'], blog_info['posts_total'])
         
         return blog_info
     
@@ -368,11 +383,12 @@ class TumblrAPIClient:
         Close the session and clean up resources.
         
         This method should be called when done with the client to ensure
-        proper cleanup of network connections.
+        proper cleanup of network connections. A session passed in by the
+        caller is left open.
         """
-        if self.session:
+        if self.session and self._owns_session:
             self.session.close()
-            logger.debug(f"Closed session for blog: {self.blog_name}")
+            logger.debug("Closed session for blog: %s", self.blog_name)
     
     def __enter__(self):
         """Context manager entry."""
@@ -0,0 +1,116 @@
+"""
+Resume checkpoint module for interrupted Tumblr downloads.
+
+This module persists a small JSON record of how far a download has
+progressed through a blog's posts, so that an interrupted run can resume
+pagination from that offset instead of re-fetching every post.
+"""
+
+import json
+import os
+import tempfile
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Optional, Union
+
+
+class Checkpoint:
+    """
+    Manages the resume checkpoint file for a download directory.
+
+    The checkpoint records the blog name, the offset of the next post to
+    process and the time it was written. Checkpoints older than MAX_AGE
+    or belonging to a different blog are ignored.
+    """
+
+    FILENAME = "checkpoint.json"
+    MAX_AGE = timedelta(hours=24)
+    
+    __slots__ = ('output_dir', 'checkpoint_path')
+
+    def __init__(self, output_dir: Union[str, Path]):
+        """
+        Initialize the Checkpoint.
+
+        Args:
+            output_dir: Directory where checkpoint.json will be stored
+        """
+        self.output_dir = Path(output_dir)
+        self.checkpoint_path = self.output_dir / self.FILENAME
+
+    def load(self, blog_name: str) -> Optional[int]:
+        """
+        Load the resume offset for a blog if a usable checkpoint exists.
+
+        Args:
+            blog_name: Name of the blog being downloaded
+
+        Returns:
+            Offset of the next post to process, or None if there is no
+            checkpoint, it is unreadable, stale, or for another blog
+        """
+        try:
+            with open(self.checkpoint_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+
+            if data.get('blog') != blog_name:
+                return None
+
+            written = datetime.fromisoformat(data['timestamp'])
+            if datetime.utcnow() - written > self.MAX_AGE:
+                return None
+
+            offset = int(data['offset'])
+            return offset if offset > 0 else None
+
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            return None
+
+    def save(self, blog_name: str, offset: int) -> None:
+        """
+        Write the checkpoint to disk using atomic write operation.
+
+        Args:
+            blog_name: Name of the blog being downloaded
+            offset: Offset of the next post to process
+
+        Raises:
+            IOError: If the checkpoint cannot be written to disk
+        """
+        data = {
+            'blog': blog_name,
+            'offset': offset,
+            'timestamp': datetime.utcnow().isoformat()
+        }
+
+        fd, temp_path = tempfile.mkstemp(
+            dir=self.output_dir,
+            prefix='.checkpoint_',
+            suffix='.tmp'
+        )
+
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(data, f)
+                f.flush()
+                os.fsync(f.fileno())
+
+            os.replace(temp_path, self.checkpoint_path)
+
+        except Exception as e:
+            try:
+                os.unlink(temp_path)
+            except OSError:
+                pass
+            raise IOError(f"Failed to save checkpoint to {self.checkpoint_path}: {e}")
+
+    def clear(self) -> None:
+        """Remove the checkpoint file if present."""
+        try:
+            os.unlink(self.checkpoint_path)
+        except FileNotFoundError:
+            pass
+
+    def __repr__(self) -> str:
+        """Return string representation of the Checkpoint."""
+        return f"Checkpoint(output_dir='{self.output_dir}')"
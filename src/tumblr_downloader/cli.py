@@ -7,15 +7,15 @@ and comprehensive error handling.
 """
 
 import argparse
+import functools
 import logging
 import sys
 import time
 from datetime import datetime
 from pathlib import Path
-from typing import Dict
+from typing import Dict, List, Optional, Union
 
-from .api_client import TumblrAPIClient, TumblrAPIError, BlogNotFoundError, RateLimitError
-from .downloader import MediaDownloader
+from .checkpoint import Checkpoint
 from .manifest import ManifestWriter
 from .media_selector import extract_media_from_post
 from .utils import setup_logging, parse_blog_name
@@ -23,13 +23,60 @@ from .utils import setup_logging, parse_blog_name
 
 logger = logging.getLogger('tumblr_downloader')
 
+# Statistics counter and manifest status for a download result, keyed by
+# (success, skipped)
+_RESULT_OUTCOMES = {
+    (True, False): ('files_downloaded', 'success'),
+    (True, True): ('files_skipped', 'success'),
+    (False, False): ('files_failed', 'failed'),
+    (False, True): ('files_failed', 'failed'),
+}
 
-def parse_arguments() -> argparse.Namespace:
+# Horizontal rule framing the banner and summary blocks
+_RULE = "=" * 70
+
+# Banner block rendered with a single format_map() call
+_BANNER_TEMPLATE = (
+    _RULE + "\n"
+    "Tumblr Media Downloader - {mode}\n"
+    + _RULE + "\n"
+    "Blog:       {blog_name}\n"
+    "Output:     {output_dir}\n"
+    "Started:    {started}\n"
+    + _RULE + "\n"
+    "\n"
+)
+
+# Summary block rendered with a single format_map() call
+_SUMMARY_TEMPLATE = (
+    "\n"
+    + _RULE + "\n"
+    "DOWNLOAD SUMMARY\n"
+    + _RULE + "\n"
+    "Posts processed:        {posts_processed}\n"
+    "Posts with media:       {posts_with_media}\n"
+    "Total media found:      {media_found}\n"
+    "Files downloaded:       {files_downloaded}\n"
+    "Files skipped:          {files_skipped}\n"
+    "Files failed:           {files_failed}\n"
+    "Total bytes:            {bytes_downloaded:,} bytes\n"
+    "Elapsed time:           {elapsed_time:.2f} seconds\n"
+    "{speed_line}"
+    + _RULE + "\n"
+)
+
+
+@functools.lru_cache(maxsize=None)
+def build_parser() -> argparse.ArgumentParser:
     """
-    Parse command-line arguments.
+    Build the command-line argument parser.
+    
+    The parser is constructed once and reused; parse_args() does not
+    modify it, so repeated invocations (e.g. from tests or scripts) skip
+    re-declaring every option.
     
     Returns:
-        Parsed argument namespace
+        Configured argument parser
     """
     parser = argparse.ArgumentParser(
         description='Download media from Tumblr blogs',
@@ -88,10 +135,23 @@ Examples:
         help='Enable verbose debug logging'
     )
     
-    return parser.parse_args()
+    return parser
 
 
-def print_banner(blog_name: str, output_dir: str, dry_run: bool) -> None:
+def parse_arguments(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """
+    Parse command-line arguments.
+    
+    Args:
+        argv: Arguments to parse (default: sys.argv[1:])
+    
+    Returns:
+        Parsed argument namespace
+    """
+    return build_parser().parse_args(argv)
+
+
+def print_banner(blog_name: str, output_dir: Union[str, Path], dry_run: bool) -> None:
     """
     Print a banner with download configuration.
     
@@ -100,15 +160,13 @@ def print_banner(blog_name: str, output_dir: str, dry_run: bool) -> None:
         output_dir: Output directory path
         dry_run: Whether this is a dry run
     """
-    mode = "DRY RUN MODE" if dry_run else "DOWNLOAD MODE"
-    print("=" * 70)
-    print(f"Tumblr Media Downloader - {mode}")
-    print("=" * 70)
-    print(f"Blog:       {blog_name}")
-    print(f"Output:     {output_dir}")
-    print(f"Started:    {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    print("=" * 70)
-    print()
+    sys.stdout.write(_BANNER_TEMPLATE.format_map({
+        'mode': "DRY RUN MODE" if dry_run else "DOWNLOAD MODE",
+        'blog_name': blog_name,
+        'output_dir': output_dir,
+        'started': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+    }))
+    sys.stdout.flush()
 
 
 def print_summary(stats: Dict[str, int], elapsed_time: float) -> None:
@@ -119,24 +177,25 @@ def print_summary(stats: Dict[str, int], elapsed_time: float) -> None:
         stats: Dictionary containing statistics
         elapsed_time: Total elapsed time in seconds
     """
-    print()
-    print("=" * 70)
-    print("DOWNLOAD SUMMARY")
-    print("=" * 70)
-    print(f"Posts processed:        {stats.get('posts_processed', 0)}")
-    print(f"Posts with media:       {stats.get('posts_with_media', 0)}")
-    print(f"Total media found:      {stats.get('media_found', 0)}")
-    print(f"Files downloaded:       {stats.get('files_downloaded', 0)}")
-    print(f"Files skipped:          {stats.get('files_skipped', 0)}")
-    print(f"Files failed:           {stats.get('files_failed', 0)}")
-    print(f"Total bytes:            {stats.get('bytes_downloaded', 0):,} bytes")
-    print(f"Elapsed time:           {elapsed_time:.2f} seconds")
+    posts_processed = stats.get('posts_processed', 0)
     
-    if stats.get('posts_processed', 0) > 0 and elapsed_time > 0:
-        posts_per_sec = stats['posts_processed'] / elapsed_time
-        print(f"Average speed:          {posts_per_sec:.2f} posts/sec")
+    speed_line = ""
+    if posts_processed > 0 and elapsed_time > 0:
+        posts_per_sec = posts_processed / elapsed_time
+        speed_line = f"Average speed:          {posts_per_sec:.2f} posts/sec\n"
     
-    print("=" * 70)
+    sys.stdout.write(_SUMMARY_TEMPLATE.format_map({
+        'posts_processed': posts_processed,
+        'posts_with_media': stats.get('posts_with_media', 0),
+        'media_found': stats.get('media_found', 0),
+        'files_downloaded': stats.get('files_downloaded', 0),
+        'files_skipped': stats.get('files_skipped', 0),
+        'files_failed': stats.get('files_failed', 0),
+        'bytes_downloaded': stats.get('bytes_downloaded', 0),
+        'elapsed_time': elapsed_time,
+        'speed_line': speed_line,
+    }))
+    sys.stdout.flush()
 
 
 def main() -> int:
@@ -149,6 +208,13 @@ def main() -> int:
     # Parse arguments
     args = parse_arguments()
     
+    # Imported here so that --help and argument errors don't pay for
+    # loading requests and urllib3
+    import requests
+    
+    from .api_client import TumblrAPIClient, TumblrAPIError, BlogNotFoundError, RateLimitError
+    from .downloader import MediaDownloader
+    
     # Setup logging
     setup_logging(verbose=args.verbose)
     
@@ -163,66 +229,113 @@ def main() -> int:
         'bytes_downloaded': 0
     }
     
-    start_time = time.time()
+    # Monotonic clock for the elapsed time
+    start_time = time.monotonic()
+    
+    # One HTTP session (and connection pool) shared by the API client and
+    # the media downloader
+    session = requests.Session()
+    downloader = None
     
     try:
         # Parse blog name from URL or raw input
         try:
             blog_name = parse_blog_name(args.blog)
-            logger.info(f"Parsed blog name: {blog_name}")
+            logger.info("Parsed blog name: %s", blog_name)
         except ValueError as e:
-            logger.error(f"Invalid blog name or URL: {e}")
+            logger.error("Invalid blog name or URL: %s", e)
             return 1
         
         # Create output directory
         output_dir = Path(args.out)
         try:
             output_dir.mkdir(parents=True, exist_ok=True)
-            logger.info(f"Output directory ready: {output_dir}")
+            logger.info("Output directory ready: %s", output_dir)
         except OSError as e:
-            logger.error(f"Failed to create output directory: {e}")
+            logger.error("Failed to create output directory: %s", e)
             return 1
         
         # Print banner
-        print_banner(blog_name, str(output_dir), args.dry_run)
+        print_banner(blog_name, output_dir, args.dry_run)
         
         # Initialize API client
         try:
-            api_client = TumblrAPIClient(blog_name)
+            api_client = TumblrAPIClient(blog_name, session=session)
             logger.info("API client initialized")
         except ValueError as e:
-            logger.error(f"Failed to initialize API client: {e}")
+            logger.error("Failed to initialize API client: %s", e)
             return 1
         
         # Initialize manifest writer (loads existing manifest if present)
         try:
-            manifest = ManifestWriter(str(output_dir))
+            manifest = ManifestWriter(output_dir)
             existing_count = len(manifest.posts)
             if existing_count > 0:
-                logger.info(f"Loaded existing manifest with {existing_count} posts")
+                logger.info("Loaded existing manifest with %d posts", existing_count)
                 print(f"Found existing manifest with {existing_count} posts")
         except Exception as e:
-            logger.error(f"Failed to initialize manifest: {e}")
+            logger.error("Failed to initialize manifest: %s", e)
             return 1
         
+        # Resume from a recent checkpoint (dry runs never read or write one)
+        checkpoint = None if args.dry_run else Checkpoint(output_dir)
+        start_offset = 0
+        if checkpoint is not None:
+            start_offset = checkpoint.load(blog_name) or 0
+            if start_offset:
+                logger.info("Resuming from checkpoint at post offset %d", start_offset)
+                print(f"Resuming from post offset {start_offset}")
+        
         # Initialize media downloader
         try:
             downloader = MediaDownloader(
-                output_dir=str(output_dir),
+                output_dir=output_dir,
                 concurrency=args.concurrency,
-                dry_run=args.dry_run
+                dry_run=args.dry_run,
+                session=session
             )
             logger.info("Media downloader initialized")
         except Exception as e:
-            logger.error(f"Failed to initialize downloader: {e}")
+            logger.error("Failed to initialize downloader: %s", e)
             return 1
         
+        # Posts before the checkpoint offset count towards --max-posts; a
+        # limit already reached leaves nothing to fetch
+        max_posts = args.max_posts
+        if max_posts is not None:
+            max_posts = max(0, max_posts - start_offset)
+        
         # Fetch and process posts
-        print("Fetching posts from Tumblr...")
-        print()
+        print("Fetching posts from Tumblr...\n")
+        
+        # Posts fully handled so far, and the offset a resumed run may skip
+        # to. The offset only advances while no download has failed, so a
+        # resumed run starts at the first page with a failure and retries it
+        completed_posts = 0
+        resume_offset = start_offset
+        interrupted = False
+        
+        # Manifest entries buffered until the next page boundary or the end
+        pending_posts = []
         
         try:
-            for post in api_client.get_posts(limit=args.max_posts):
+            for post in api_client.get_posts(limit=max_posts, start=start_offset):
+                # Persist progress once per page so the manifest and the
+                # checkpoint always agree on which posts are done; only the
+                # page's new entries are journaled, the full manifest is
+                # written once at the end
+                if (checkpoint is not None and completed_posts
+                        and completed_posts % TumblrAPIClient.POSTS_PER_PAGE == 0):
+                    if stats['files_failed'] == 0:
+                        resume_offset = start_offset + completed_posts
+                    try:
+                        manifest.add_posts(pending_posts)
+                        pending_posts.clear()
+                        manifest.append_journal()
+                        checkpoint.save(blog_name, resume_offset)
+                    except (IOError, ValueError) as e:
+                        logger.warning("Failed to write checkpoint: %s", e)
+                
                 post_id = str(post.get('id', 'unknown'))
                 post_type = post.get('type', 'unknown')
                 post_url = post.get('post-url', '')
@@ -233,76 +346,73 @@ def main() -> int:
                 if stats['posts_processed'] % 10 == 0:
                     print(f"Processed {stats['posts_processed']} posts...", end='\r')
                 
-                logger.debug(f"Processing post {post_id} (type: {post_type})")
+                logger.debug("Processing post %s (type: %s)", post_id, post_type)
                 
                 # Extract media from post
                 try:
                     media_items = extract_media_from_post(post)
                 except Exception as e:
-                    logger.warning(f"Failed to extract media from post {post_id}: {e}")
+                    logger.warning("Failed to extract media from post %s: %s", post_id, e)
                     media_items = []
                 
                 if not media_items:
-                    logger.debug(f"No media found in post {post_id}")
+                    logger.debug("No media found in post %s", post_id)
+                    completed_posts = stats['posts_processed']
                     continue
                 
                 stats['posts_with_media'] += 1
                 stats['media_found'] += len(media_items)
                 
-                logger.info(f"Found {len(media_items)} media item(s) in post {post_id}")
+                logger.info("Found %d media item(s) in post %s", len(media_items), post_id)
                 
                 # Download media files
                 try:
                     download_results = downloader.download_media(media_items)
                 except Exception as e:
-                    logger.error(f"Failed to download media for post {post_id}: {e}")
+                    logger.error("Failed to download media for post %s: %s", post_id, e)
                     download_results = []
+                    stats['files_failed'] += len(media_items)
                 
-                # Update statistics
-                for result in download_results:
-                    if result.get('success'):
-                        if result.get('skipped'):
-                            stats['files_skipped'] += 1
-                        else:
-                            stats['files_downloaded'] += 1
-                            stats['bytes_downloaded'] += result.get('bytes_downloaded', 0)
-                    else:
-                        stats['files_failed'] += 1
-                
-                # Prepare media results for manifest
+                # Update statistics and prepare media results for manifest
+                # (skipped and failed results carry 0 bytes)
                 media_results = []
                 for result in download_results:
-                    media_entry = {
-                        'media_sources': [result.get('url', '')],
-                        'chosen_url': result.get('url', ''),
+                    key = (bool(result.get('success')), bool(result.get('skipped')))
+                    stat_field, status = _RESULT_OUTCOMES[key]
+                    url = result.get('url', '')
+                    bytes_downloaded = result.get('bytes_downloaded', 0)
+                    
+                    stats[stat_field] += 1
+                    stats['bytes_downloaded'] += bytes_downloaded
+                    
+                    media_results.append({
+                        'media_sources': [url],
+                        'chosen_url': url,
                         'downloaded_filename': result.get('filename', ''),
                         'width': result.get('width', 0),
                         'height': result.get('height', 0),
-                        'bytes': result.get('bytes_downloaded', 0),
+                        'bytes': bytes_downloaded,
                         'type': result.get('type', 'unknown'),
-                        'status': 'success' if result.get('success') else 'failed'
-                    }
-                    media_results.append(media_entry)
+                        'status': status
+                    })
                 
-                # Update manifest
-                try:
-                    post_data = {
-                        'post_id': post_id,
-                        'post_url': post_url,
-                        'timestamp': datetime.utcnow().isoformat(),
-                        'tags': post.get('tags', [])
-                    }
-                    manifest.add_post(post_data, media_results)
-                except Exception as e:
-                    logger.error(f"Failed to update manifest for post {post_id}: {e}")
+                # Queue manifest update
+                post_data = {
+                    'post_id': post_id,
+                    'post_url': post_url,
+                    'timestamp': datetime.utcnow().isoformat(),
+                    'tags': post.get('tags', [])
+                }
+                pending_posts.append((post_data, media_results))
+                completed_posts = stats['posts_processed']
         
         except BlogNotFoundError:
-            logger.error(f"Blog '{blog_name}' not found")
+            logger.error("Blog '%s' not found", blog_name)
             print(f"\nError: Blog '{blog_name}' does not exist or is not accessible")
             return 1
         
         except RateLimitError as e:
-            logger.error(f"Rate limit exceeded: {e}")
+            logger.error("Rate limit exceeded: %s", e)
             print("\nError: Rate limit exceeded. Please try again later.")
             return 1
         
@@ -310,24 +420,38 @@ def main() -> int:
             print("\n\nDownload interrupted by user")
             logger.info("Download interrupted by KeyboardInterrupt")
             print("Saving progress to manifest...")
+            interrupted = True
         
         except TumblrAPIError as e:
-            logger.error(f"Tumblr API error: {e}")
+            logger.error("Tumblr API error: %s", e)
             print(f"\nError: API request failed - {e}")
             return 1
         
         # Save manifest
         print("\nSaving manifest...")
         try:
+            manifest.add_posts(pending_posts)
             manifest.save()
-            logger.info(f"Manifest saved to {manifest.manifest_path}")
+            logger.info("Manifest saved to %s", manifest.manifest_path)
         except Exception as e:
-            logger.error(f"Failed to save manifest: {e}")
+            logger.error("Failed to save manifest: %s", e)
             print(f"Warning: Failed to save manifest - {e}")
             return 1
         
+        # Record where to resume, or drop the checkpoint once the run completes
+        if checkpoint is not None:
+            try:
+                if interrupted:
+                    if stats['files_failed'] == 0:
+                        resume_offset = start_offset + completed_posts
+                    checkpoint.save(blog_name, resume_offset)
+                else:
+                    checkpoint.clear()
+            except (IOError, OSError) as e:
+                logger.warning("Failed to update checkpoint: %s", e)
+        
         # Calculate elapsed time
-        elapsed_time = time.time() - start_time
+        elapsed_time = time.monotonic() - start_time
         
         # Print summary
         print_summary(stats, elapsed_time)
@@ -337,9 +461,14 @@ def main() -> int:
         return 0
     
     except Exception as e:
-        logger.exception(f"Unexpected error: {e}")
+        logger.exception("Unexpected error: %s", e)
         print(f"\nUnexpected error: {e}")
         return 1
+    
+    finally:
+        if downloader is not None:
+            downloader.close()
+        session.close()
 
 
 if __name__ == '__main__':
@@ -7,26 +7,40 @@ and comprehensive error handling.
 
 import logging
 import os
+import threading
 import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Dict, List, Optional
-from urllib.parse import urlparse
+from typing import Dict, List, Optional, Union
 
 import requests
-from requests.adapters import HTTPAdapter
+from requests.adapters import DEFAULT_POOLSIZE, HTTPAdapter
 from urllib3.util.retry import Retry
 
 from .rate_limiter import RateLimiter
 
 logger = logging.getLogger(__name__)
 
+# HTTP statuses retried by the session's adapter; checked on every response
+_RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+# Bytes read from the response per write; 128 KiB amortises the
+# per-chunk Python overhead over far more data than the old 8 KiB. Also
+# used as the output file's buffer size, so smaller chunks (e.g. from
+# decompressed responses) are coalesced into writes of the same size
+_DOWNLOAD_CHUNK_SIZE = 1 << 17
+
+# Returned by _claim_file() for files already on disk, so callers can wait
+# on it like the event of a download in progress
+_FILE_SETTLED = threading.Event()
+_FILE_SETTLED.set()
+
 
 class MediaDownloader:
     """Downloads media files with parallel processing and retry logic.
     
     Features:
-    - Parallel downloads using ThreadPoolExecutor
+    - Parallel downloads using a shared ThreadPoolExecutor
     - Rate limiting to be respectful to servers
     - Automatic retry with exponential backoff
     - Idempotent (skips existing files)
@@ -43,12 +57,13 @@ class MediaDownloader:
     
     def __init__(
         self,
-        output_dir: str,
+        output_dir: Union[str, Path],
         concurrency: int = 5,
         dry_run: bool = False,
         rate_limit: float = 2.0,
         max_retries: int = 3,
-        timeout: int = 30
+        timeout: int = 30,
+        session: Optional[requests.Session] = None
     ):
         """Initialize the media downloader.
         
@@ -59,6 +74,9 @@ class MediaDownloader:
             rate_limit: Maximum requests per second (default: 2.0).
             max_retries: Maximum number of retry attempts per file (default: 3).
             timeout: Request timeout in seconds (default: 30).
+            session: Optional session shared with other clients so they use
+                one connection pool; the caller remains responsible for
+                closing it (default: None, create a private session).
         
         Raises:
             ValueError: If concurrency is not positive or output_dir is invalid.
@@ -76,40 +94,93 @@ class MediaDownloader:
         if not dry_run:
             self.output_dir.mkdir(parents=True, exist_ok=True)
         
+        # Worker pool for parallel downloads, created on first use and shared
+        # across download_media() calls
+        self._executor: Optional[ThreadPoolExecutor] = None
+        
+        # Sizes of files already in the output directory, keyed by name, so
+        # skip checks don't need a stat() per media item, plus the files
+        # being downloaded right now, each mapped to an event set once its
+        # download finishes. Both are shared by the worker threads and only
+        # touched while holding _files_lock.
+        self._existing_files = self._scan_output_dir()
+        self._in_progress: Dict[str, threading.Event] = {}
+        self._files_lock = threading.Lock()
+        
         # Initialize rate limiter
         self.rate_limiter = RateLimiter(max_per_second=rate_limit)
         
         # Configure requests session with retry logic
-        self.session = self._create_session()
+        self._owns_session = session is None
+        self.session = self._create_session(session)
         
         logger.info(
-            f"MediaDownloader initialized: output_dir={output_dir}, "
-            f"concurrency={concurrency}, dry_run={dry_run}, "
-            f"rate_limit={rate_limit}/s"
+            "MediaDownloader initialized: output_dir=%s, concurrency=%d, "
+            "dry_run=%s, rate_limit=%s/s",
+            output_dir, concurrency, dry_run, rate_limit
         )
     
-    def _create_session(self) -> requests.Session:
-        """Create a requests session with retry configuration.
+    def _create_session(self, session: Optional[requests.Session] = None) -> requests.Session:
+        """Create or configure a requests session with retry configuration.
+        
+        Args:
+            session: Existing session to configure; a new one is created
+                if None.
         
         Returns:
             Configured requests session with retry adapter.
         """
-        session = requests.Session()
+        if session is None:
+            session = requests.Session()
         
         # Configure retry strategy
         retry_strategy = Retry(
             total=self.max_retries,
             backoff_factor=1,  # Exponential backoff: 0s, 1s, 2s, 4s...
-            status_forcelist=[429, 500, 502, 503, 504],
+            status_forcelist=_RETRY_STATUS_CODES,
             allowed_methods=["HEAD", "GET", "OPTIONS"]
         )
         
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        # Keep one pooled connection per worker so concurrent downloads from
+        # the same CDN host reuse connections instead of discarding them
+        adapter = HTTPAdapter(
+            max_retries=retry_strategy,
+            pool_maxsize=max(self.concurrency, DEFAULT_POOLSIZE)
+        )
         session.mount("http://", adapter)
         session.mount("https://", adapter)
         
         return session
     
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Return the worker pool, creating it on first use.
+        
+        Returns:
+            ThreadPoolExecutor with ``concurrency`` workers.
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.concurrency,
+                thread_name_prefix="download"
+            )
+        return self._executor
+    
+    def _scan_output_dir(self) -> Dict[str, int]:
+        """List the output directory once and record existing file sizes.
+        
+        Returns:
+            Dictionary mapping file names to their size in bytes.
+        """
+        try:
+            with os.scandir(self.output_dir) as entries:
+                return {
+                    entry.name: entry.stat().st_size
+                    for entry in entries
+                    if entry.is_file()
+                }
+        except FileNotFoundError:
+            return {}
+    
     def download_media(self, media_items: List[Dict]) -> List[Dict]:
         """Download multiple media files in parallel.
         
@@ -133,21 +204,38 @@ class MediaDownloader:
             logger.warning("No media items to download")
             return []
         
-        logger.info(f"Starting download of {len(media_items)} media items")
-        start_time = time.time()
+        logger.info("Starting download of %d media items", len(media_items))
+        start_time = time.monotonic()
         
         results = []
-        
-        # Use ThreadPoolExecutor for parallel downloads
-        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
-            # Submit all download tasks
-            future_to_item = {
-                executor.submit(self._download_single, item): item
-                for item in media_items
-            }
+        pending = []
+        
+        # Resolve items that already exist on disk up front, so posts that
+        # are entirely skipped (the common case on resume) never start a
+        # thread pool
+        for item in media_items:
+            filename = self._existing_filename(item)
+            if filename is None:
+                pending.append(item)
+                continue
             
+            results.append(self._skipped_result(item, filename))
+            logger.info("[%d/%d] SKIPPED: %s", len(results), len(media_items), filename)
+        
+        if not pending:
+            logger.info("All %d media items already downloaded", len(media_items))
+            return results
+        
+        # Submit to the shared worker pool, which lives as long as the downloader
+        executor = self._get_executor()
+        future_to_item = {
+            executor.submit(self._download_single, item): item
+            for item in pending
+        }
+        
+        try:
             # Process completed downloads
-            for i, future in enumerate(as_completed(future_to_item), 1):
+            for i, future in enumerate(as_completed(future_to_item), len(results) + 1):
                 item = future_to_item[future]
                 try:
                     result = future.result()
@@ -159,12 +247,12 @@ class MediaDownloader:
                         status = "SKIPPED"
                     
                     logger.info(
-                        f"[{i}/{len(media_items)}] {status}: "
-                        f"{result.get('filename', 'N/A')}"
+                        "[%d/%d] %s: %s",
+                        i, len(media_items), status, result.get('filename', 'N/A')
                     )
                     
                 except Exception as e:
-                    logger.error(f"Unexpected error processing item: {e}")
+                    logger.error("Unexpected error processing item: %s", e)
                     results.append({
                         **item,
                         "success": False,
@@ -172,17 +260,23 @@ class MediaDownloader:
                         "bytes_downloaded": 0
                     })
         
+        except BaseException:
+            # Don't start downloads that are still queued (e.g. on Ctrl-C)
+            for future in future_to_item:
+                future.cancel()
+            raise
+        
         # Calculate statistics
-        elapsed_time = time.time() - start_time
+        elapsed_time = time.monotonic() - start_time
         successful = sum(1 for r in results if r["success"])
         failed = sum(1 for r in results if not r["success"] and not r.get("skipped"))
         skipped = sum(1 for r in results if r.get("skipped"))
         total_bytes = sum(r.get("bytes_downloaded", 0) for r in results)
         
         logger.info(
-            f"Download complete: {successful} successful, {failed} failed, "
-            f"{skipped} skipped | {total_bytes / 1024 / 1024:.2f} MB in "
-            f"{elapsed_time:.2f}s"
+            "Download complete: %d successful, %d failed, %d skipped | "
+            "%.2f MB in %.2fs",
+            successful, failed, skipped, total_bytes / 1024 / 1024, elapsed_time
         )
         
         return results
@@ -202,7 +296,7 @@ class MediaDownloader:
         post_id = media_item.get("post_id", "unknown")
         
         if not url:
-            logger.error(f"No URL provided for media item: {media_item}")
+            logger.error("No URL provided for media item: %s", media_item)
             return {
                 **media_item,
                 "success": False,
@@ -212,11 +306,10 @@ class MediaDownloader:
         
         # Generate filename
         try:
-            original_filename = self._extract_filename(url)
-            filename = f"{post_id}_{original_filename}"
+            filename = self._make_filename(url, post_id)
             filepath = self.output_dir / filename
         except Exception as e:
-            logger.error(f"Error generating filename for {url}: {e}")
+            logger.error("Error generating filename for %s: %s", url, e)
             return {
                 **media_item,
                 "success": False,
@@ -224,21 +317,47 @@ class MediaDownloader:
                 "bytes_downloaded": 0
             }
         
-        # Check if file should be skipped (already exists)
-        if self._should_skip(filepath):
-            logger.debug(f"Skipping existing file: {filename}")
-            return {
-                **media_item,
-                "success": True,
-                "skipped": True,
-                "filename": filename,
-                "filepath": str(filepath),
-                "bytes_downloaded": 0
-            }
+        # Skip existing files, and reserve the rest so that two workers never
+        # write the same path (e.g. a URL repeated within a post). A file
+        # another worker is downloading is only skipped once that download
+        # has succeeded; if it failed, this worker takes over.
+        while True:
+            pending = self._claim_file(filename)
+            if pending is None:
+                break
+            pending.wait()
+            if self._should_skip(filename):
+                logger.debug("Skipping existing file: %s", filename)
+                return self._skipped_result(media_item, filename)
+        
+        result = None
+        try:
+            result = self._fetch_file(media_item, url, filename, filepath)
+            return result
+        finally:
+            self._release_file(filename, result)
+    
+    def _fetch_file(
+        self,
+        media_item: Dict,
+        url: str,
+        filename: str,
+        filepath: Path
+    ) -> Dict:
+        """Download a claimed media file with rate limiting and retries.
+        
+        Args:
+            media_item: The original media item dictionary.
+            url: URL to download from.
+            filename: Name of the file within the output directory.
+            filepath: Full path the file is written to.
         
+        Returns:
+            Result dictionary with download status and metadata.
+        """
         # Dry-run mode: simulate download
         if self.dry_run:
-            logger.info(f"[DRY RUN] Would download: {url} -> {filename}")
+            logger.info("[DRY RUN] Would download: %s -> %s", url, filename)
             return {
                 **media_item,
                 "success": True,
@@ -256,7 +375,8 @@ class MediaDownloader:
                 
                 # Download the file
                 logger.debug(
-                    f"Downloading {url} (attempt {attempt + 1}/{self.max_retries + 1})"
+                    "Downloading %s (attempt %d/%d)",
+                    url, attempt + 1, self.max_retries + 1
                 )
                 
                 response = self.session.get(
@@ -268,15 +388,15 @@ class MediaDownloader:
                 
                 # Write file to disk
                 bytes_downloaded = 0
-                with open(filepath, "wb") as f:
-                    for chunk in response.iter_content(chunk_size=8192):
+                with open(filepath, "wb", buffering=_DOWNLOAD_CHUNK_SIZE) as f:
+                    for chunk in response.iter_content(chunk_size=_DOWNLOAD_CHUNK_SIZE):
                         if chunk:
                             f.write(chunk)
                             bytes_downloaded += len(chunk)
                 
                 logger.debug(
-                    f"Successfully downloaded {filename} "
-                    f"({bytes_downloaded / 1024:.2f} KB)"
+                    "Successfully downloaded %s (%.2f KB)",
+                    filename, bytes_downloaded / 1024
                 )
                 
                 return {
@@ -289,8 +409,8 @@ class MediaDownloader:
                 
             except requests.exceptions.Timeout as e:
                 logger.warning(
-                    f"Timeout downloading {url} "
-                    f"(attempt {attempt + 1}/{self.max_retries + 1}): {e}"
+                    "Timeout downloading %s (attempt %d/%d): %s",
+                    url, attempt + 1, self.max_retries + 1, e
                 )
                 if attempt == self.max_retries:
                     return {
@@ -303,8 +423,8 @@ class MediaDownloader:
                 
             except requests.exceptions.RequestException as e:
                 logger.warning(
-                    f"Error downloading {url} "
-                    f"(attempt {attempt + 1}/{self.max_retries + 1}): {e}"
+                    "Error downloading %s (attempt %d/%d): %s",
+                    url, attempt + 1, self.max_retries + 1, e
                 )
                 if attempt == self.max_retries:
                     return {
@@ -316,7 +436,7 @@ class MediaDownloader:
                 time.sleep(2 ** attempt)  # Exponential backoff
                 
             except Exception as e:
-                logger.error(f"Unexpected error downloading {url}: {e}")
+                logger.error("Unexpected error downloading %s: %s", url, e)
                 return {
                     **media_item,
                     "success": False,
@@ -332,6 +452,61 @@ class MediaDownloader:
             "bytes_downloaded": 0
         }
     
+    def _make_filename(self, url: str, post_id: str) -> str:
+        """Build the local filename for a media URL.
+        
+        Args:
+            url: URL of the media file.
+            post_id: Post ID used as the filename prefix.
+        
+        Returns:
+            Filename of the form ``<post_id>_<original filename>``.
+        
+        Raises:
+            ValueError: If URL is invalid or has no filename.
+        """
+        return f"{post_id}_{self._extract_filename(url)}"
+    
+    def _existing_filename(self, media_item: Dict) -> Optional[str]:
+        """Return the filename of a media item if it is already downloaded.
+        
+        Args:
+            media_item: Media item dictionary with url and post_id.
+        
+        Returns:
+            The filename if the file exists and should be skipped, None
+            otherwise (including when no filename can be derived).
+        """
+        url = media_item.get("url")
+        if not url:
+            return None
+        
+        try:
+            filename = self._make_filename(url, media_item.get("post_id", "unknown"))
+        except ValueError:
+            return None
+        
+        return filename if self._should_skip(filename) else None
+    
+    def _skipped_result(self, media_item: Dict, filename: str) -> Dict:
+        """Build the result dictionary for a skipped (existing) file.
+        
+        Args:
+            media_item: The original media item dictionary.
+            filename: Name of the existing file.
+        
+        Returns:
+            Result dictionary marking the item as skipped.
+        """
+        return {
+            **media_item,
+            "success": True,
+            "skipped": True,
+            "filename": filename,
+            "filepath": str(self.output_dir / filename),
+            "bytes_downloaded": 0
+        }
+    
     def _extract_filename(self, url: str) -> str:
         """Extract filename from URL.
         
@@ -344,33 +519,90 @@ class MediaDownloader:
         Raises:
             ValueError: If URL is invalid or has no filename.
         """
-        parsed = urlparse(url)
-        path = parsed.path
+        # Plain string splitting is enough to isolate the path here and
+        # avoids building a full ParseResult for every media URL
+        path = url.split('#', 1)[0].split('?', 1)[0]
+        if path.startswith('//'):
+            # Scheme-relative URL: the host follows directly
+            host_start = 2
+        else:
+            host_start = path.find('://')
+            if host_start != -1:
+                host_start += 3
+        if host_start != -1:
+            host_end = path.find('/', host_start)
+            path = path[host_end:] if host_end != -1 else ''
         
         if not path or path == "/":
             raise ValueError(f"No filename in URL: {url}")
         
-        filename = os.path.basename(path)
+        filename = os.path.basename(path).split(';', 1)[0]
         
         if not filename:
             raise ValueError(f"Could not extract filename from URL: {url}")
         
         return filename
     
-    def _should_skip(self, filepath: Path) -> bool:
+    def _should_skip(self, filename: str) -> bool:
         """Check if a file should be skipped (already exists).
         
+        Uses the directory snapshot taken at initialization, kept up to date
+        as files are downloaded, instead of stat'ing the file.
+        
         Args:
-            filepath: Path to check.
+            filename: Name of the file within the output directory.
         
         Returns:
             True if file exists and should be skipped, False otherwise.
         """
-        return filepath.exists() and filepath.stat().st_size > 0
+        with self._files_lock:
+            return self._existing_files.get(filename, 0) > 0
+    
+    def _claim_file(self, filename: str) -> Optional[threading.Event]:
+        """Reserve a file for downloading unless it exists or is in progress.
+        
+        Args:
+            filename: Name of the file within the output directory.
+        
+        Returns:
+            None if the caller now owns the download. Otherwise an event to
+            wait on before checking the file again: already set if the file
+            exists, or set by the owning worker when its download finishes.
+        """
+        with self._files_lock:
+            if self._existing_files.get(filename, 0) > 0:
+                return _FILE_SETTLED
+            pending = self._in_progress.get(filename)
+            if pending is not None:
+                return pending
+            self._in_progress[filename] = threading.Event()
+            return None
+    
+    def _release_file(self, filename: str, result: Optional[Dict]) -> None:
+        """Release a claimed file, recording it if it was downloaded.
+        
+        Args:
+            filename: Name of the file within the output directory.
+            result: Result of the download attempt, or None if it raised.
+        """
+        with self._files_lock:
+            pending = self._in_progress.pop(filename)
+            if result and result["success"] and result["bytes_downloaded"] > 0:
+                self._existing_files[filename] = result["bytes_downloaded"]
+        pending.set()
     
     def close(self) -> None:
-        """Close the downloader and clean up resources."""
-        if self.session:
+        """Close the downloader and clean up resources.
+        
+        Waits for running downloads to finish. A session passed in by the
+        caller is left open.
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+            logger.debug("Downloader worker pool shut down")
+        
+        if self.session and self._owns_session:
             self.session.close()
             logger.debug("Downloader session closed")
     
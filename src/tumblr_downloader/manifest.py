@@ -9,9 +9,40 @@ import json
 import os
 import tempfile
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterable, List, Optional, Any, Tuple, Union
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:  # optional speedup, see the 'fast' extra
+    orjson = None
+
+
+def _dumps_manifest(posts_list: List[Dict[str, Any]]) -> bytes:
+    """Encode the manifest as pretty-printed, key-sorted UTF-8 JSON."""
+    if orjson is not None:
+        return orjson.dumps(
+            posts_list,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS
+        ) + b'\n'
+    return (json.dumps(
+        posts_list,
+        indent=2,
+        ensure_ascii=False,
+        sort_keys=True
+    ) + '\n').encode('utf-8')
+
+
+def _dumps_entry(entry: Dict[str, Any]) -> bytes:
+    """Encode a single manifest entry as one compact JSON line."""
+    if orjson is not None:
+        return orjson.dumps(entry, option=orjson.OPT_SORT_KEYS) + b'\n'
+    return (json.dumps(entry, ensure_ascii=False, sort_keys=True) + '\n').encode('utf-8')
+
+
+# Both accept bytes and raise json.JSONDecodeError (or a subclass) on bad input
+_loads = orjson.loads if orjson is not None else json.loads
+
 
 class ManifestWriter:
     """
@@ -19,9 +50,22 @@ class ManifestWriter:
     
     The manifest tracks all downloaded posts, their metadata, and media files,
     enabling incremental downloads and verification of existing content.
+    
+    Progress during a run can be persisted cheaply with append_journal(),
+    which appends only the entries added since the last write to a JSON
+    Lines journal next to the manifest. save() compacts everything into
+    manifest.json and removes the journal; load_existing() replays any
+    journal left behind by an interrupted run.
     """
     
-    def __init__(self, output_dir: str):
+    # Entries are added for every post with media; slots keep the
+    # attribute lookups on that path off the instance dict
+    __slots__ = (
+        'output_dir', 'manifest_path', 'journal_path', 'posts',
+        '_unsaved', '_dirty',
+    )
+    
+    def __init__(self, output_dir: Union[str, Path]):
         """
         Initialize the ManifestWriter.
         
@@ -30,8 +74,15 @@ class ManifestWriter:
         """
         self.output_dir = Path(output_dir)
         self.manifest_path = self.output_dir / "manifest.json"
+        self.journal_path = self.output_dir / "manifest.journal"
         self.posts: Dict[str, Dict[str, Any]] = {}
         
+        # Entries added since the last save() or append_journal()
+        self._unsaved: Dict[str, Dict[str, Any]] = {}
+        
+        # Whether manifest.json is out of date with self.posts
+        self._dirty = True
+        
         # Ensure output directory exists
         self.output_dir.mkdir(parents=True, exist_ok=True)
         
@@ -42,6 +93,9 @@ class ManifestWriter:
         """
         Load existing manifest from disk if present.
         
+        Entries from a journal left by an interrupted run are applied on
+        top of the manifest.
+        
         Returns:
             Dictionary of posts keyed by post_id, empty dict if no manifest exists
             
@@ -49,12 +103,9 @@ class ManifestWriter:
             IOError: If manifest exists but cannot be read
             json.JSONDecodeError: If manifest contains invalid JSON
         """
-        if not self.manifest_path.exists():
-            return {}
-        
         try:
-            with open(self.manifest_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with open(self.manifest_path, 'rb') as f:
+                data = _loads(f.read())
                 
             # Convert list format to dict keyed by post_id for easier updates
             if isinstance(data, list):
@@ -63,9 +114,11 @@ class ManifestWriter:
                 self.posts = data
             else:
                 raise ValueError(f"Unexpected manifest format: {type(data)}")
-                
-            return self.posts
             
+            self._dirty = False
+            
+        except FileNotFoundError:
+            pass
         except (IOError, OSError) as e:
             raise IOError(f"Failed to read manifest from {self.manifest_path}: {e}")
         except json.JSONDecodeError as e:
@@ -74,6 +127,49 @@ class ManifestWriter:
                 e.doc,
                 e.pos
             )
+        
+        self._replay_journal()
+        return self.posts
+    
+    def _replay_journal(self) -> None:
+        """
+        Apply entries from the journal, if one exists, to the loaded posts.
+        
+        A final line without a newline is the tail of an append that was
+        cut short; it is dropped and truncated away so later appends start
+        on a fresh line. Lines that are not valid entries are skipped. The
+        journal is only opened for writing when there is a tail to remove,
+        so a read-only output directory can still be loaded.
+        
+        Raises:
+            IOError: If the journal exists but cannot be read
+        """
+        try:
+            with open(self.journal_path, 'rb') as f:
+                data = f.read()
+        except FileNotFoundError:
+            return
+        except (IOError, OSError) as e:
+            raise IOError(f"Failed to read manifest journal from {self.journal_path}: {e}")
+        
+        complete = data.rfind(b'\n') + 1
+        if complete < len(data):
+            try:
+                os.truncate(self.journal_path, complete)
+            except OSError:
+                # Read-only output; nothing can be appended after the tail
+                pass
+        
+        for line in data[:complete].splitlines():
+            try:
+                entry = _loads(line)
+            except json.JSONDecodeError:
+                continue
+            post_id = entry.get('post_id') if isinstance(entry, dict) else None
+            if not post_id or not isinstance(post_id, str):
+                continue
+            self.posts[post_id] = entry
+            self._dirty = True
     
     def add_post(self, post_data: dict, media_results: List[dict]) -> None:
         """
@@ -95,47 +191,94 @@ class ManifestWriter:
                 - type: Media type (photo, video, etc.)
                 - status: Download status (success, failed, skipped)
         """
+        post_id, post_entry = self._build_post_entry(post_data, media_results)
+        
+        # Add or update post in manifest
+        self.posts[post_id] = post_entry
+        self._unsaved[post_id] = post_entry
+        self._dirty = True
+    
+    def add_posts(self, posts: Iterable[Tuple[dict, List[dict]]]) -> None:
+        """
+        Add or update several post entries in the manifest at once.
+        
+        All entries are built first and then merged with a single update,
+        so a failure in any entry leaves the manifest unchanged.
+        
+        Args:
+            posts: Iterable of (post_data, media_results) pairs in the
+                format accepted by add_post()
+        """
+        entries = dict(
+            self._build_post_entry(post_data, media_results)
+            for post_data, media_results in posts
+        )
+        if not entries:
+            return
+        
+        self.posts.update(entries)
+        self._unsaved.update(entries)
+        self._dirty = True
+    
+    def _build_post_entry(
+        self,
+        post_data: dict,
+        media_results: List[dict]
+    ) -> Tuple[str, Dict[str, Any]]:
+        """
+        Build a normalized manifest entry for a post.
+        
+        Args:
+            post_data: Post metadata, see add_post()
+            media_results: Media download results, see add_post()
+            
+        Returns:
+            Tuple of (post_id, post entry dictionary)
+            
+        Raises:
+            ValueError: If post_data has no valid 'post_id'
+        """
         post_id = str(post_data.get('post_id', ''))
         
         if not post_id:
             raise ValueError("post_data must contain a valid 'post_id'")
         
-        # Create post entry
         post_entry = {
             'post_id': post_id,
             'post_url': post_data.get('post_url', ''),
             'timestamp': post_data.get('timestamp', datetime.utcnow().isoformat()),
             'tags': post_data.get('tags', []),
-            'media': []
+            'media': [
+                {
+                    'media_sources': media.get('media_sources', []),
+                    'chosen_url': media.get('chosen_url', ''),
+                    'downloaded_filename': media.get('downloaded_filename', ''),
+                    'width': media.get('width'),
+                    'height': media.get('height'),
+                    'bytes': media.get('bytes'),
+                    'type': media.get('type', 'photo'),
+                    'status': media.get('status', 'unknown')
+                }
+                for media in media_results
+            ]
         }
         
-        # Add media entries
-        for media in media_results:
-            media_entry = {
-                'media_sources': media.get('media_sources', []),
-                'chosen_url': media.get('chosen_url', ''),
-                'downloaded_filename': media.get('downloaded_filename', ''),
-                'width': media.get('width'),
-                'height': media.get('height'),
-                'bytes': media.get('bytes'),
-                'type': media.get('type', 'photo'),
-                'status': media.get('status', 'unknown')
-            }
-            post_entry['media'].append(media_entry)
-        
-        # Add or update post in manifest
-        self.posts[post_id] = post_entry
+        return post_id, post_entry
     
     def save(self) -> None:
         """
         Write manifest to disk using atomic write operation.
         
         Uses a temporary file and rename to ensure atomicity and prevent
-        corruption if the write operation is interrupted.
+        corruption if the write operation is interrupted. Does nothing if
+        no entries changed since the manifest was loaded or last saved.
         
         Raises:
             IOError: If the manifest cannot be written to disk
         """
+        if not self._dirty:
+            return
+        
         try:
             # Convert dict to sorted list for consistent output
             posts_list = [self.posts[post_id] for post_id in sorted(self.posts.keys())]
@@ -148,16 +291,13 @@ class ManifestWriter:
             )
             
             try:
-                # Write pretty-printed JSON to temp file
-                with os.fdopen(fd, 'w', encoding='utf-8') as f:
-                    json.dump(
-                        posts_list,
-                        f,
-                        indent=2,
-                        ensure_ascii=False,
-                        sort_keys=True
-                    )
-                    f.write('\n')  # Add trailing newline
+                # Write pretty-printed JSON (with trailing newline) to temp file
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(_dumps_manifest(posts_list))
+                    
+                    # Make the data durable before the rename publishes it
+                    f.flush()
+                    os.fsync(f.fileno())
                 
                 # Atomic rename
                 os.replace(temp_path, self.manifest_path)
@@ -169,10 +309,44 @@ class ManifestWriter:
                 except OSError:
                     pass
                 raise IOError(f"Failed to write manifest: {e}")
+            
+            # The manifest now holds every journaled entry
+            self._dirty = False
+            self._unsaved.clear()
+            try:
+                os.unlink(self.journal_path)
+            except FileNotFoundError:
+                pass
                 
         except Exception as e:
             raise IOError(f"Failed to save manifest to {self.manifest_path}: {e}")
     
+    def append_journal(self) -> None:
+        """
+        Append entries added since the last write to the manifest journal.
+        
+        Each entry is written as one JSON line, so the cost is proportional
+        to the number of new entries rather than to the size of the whole
+        manifest. The journal is synced before returning, so a checkpoint
+        written afterwards never gets ahead of it. Call save() to compact
+        the journal into manifest.json.
+        
+        Raises:
+            IOError: If the journal cannot be written to disk
+        """
+        if not self._unsaved:
+            return
+        
+        try:
+            with open(self.journal_path, 'ab') as f:
+                f.writelines(_dumps_entry(entry) for entry in self._unsaved.values())
+                f.flush()
+                os.fsync(f.fileno())
+        except Exception as e:
+            raise IOError(f"Failed to append to manifest journal {self.journal_path}: {e}")
+        
+        self._unsaved.clear()
+    
     def get_post(self, post_id: str) -> Optional[Dict[str, Any]]:
         """
         Retrieve a specific post entry from the manifest.
@@ -13,6 +13,24 @@ from html.parser import HTMLParser
 
 logger = logging.getLogger(__name__)
 
+# v1 API photo URL fields in order of preference, paired with the size
+# encoded in each field name
+_PHOTO_URL_FIELDS = (
+    ('photo-url-1280', 1280),
+    ('photo-url-500', 500),
+    ('photo-url-400', 400),
+    ('photo-url-250', 250),
+    ('photo-url-100', 100),
+    ('photo-url-75', 75),
+)
+
+# Common Tumblr size suffix in image URLs: _1280, _500, etc.
+_URL_SIZE_RE = re.compile(r'_(\d+)(?:\.|/|$)')
+
+# Direct media file URLs inside video embed code and audio player HTML
+_VIDEO_URL_RE = re.compile(r'https?://[^\s"\'<>]+\.(?:mp4|mov|avi)')
+_AUDIO_URL_RE = re.compile(r'https?://[^\s"\'<>]+\.(?:mp3|wav|m4a|ogg)')
+
 
 class ImageExtractor(HTMLParser):
     """HTML parser to extract image URLs and dimensions from post bodies."""
@@ -32,10 +50,8 @@ class ImageExtractor(HTMLParser):
                 height = 0
                 
                 try:
-                    if 'data-orig-width' in attrs_dict:
-                        width = int(attrs_dict['data-orig-width'])
-                    if 'data-orig-height' in attrs_dict:
-                        height = int(attrs_dict['data-orig-height'])
+                    width = int(attrs_dict.get('data-orig-width') or 0)
+                    height = int(attrs_dict.get('data-orig-height') or 0)
                 except (ValueError, TypeError):
                     pass
                 
@@ -54,9 +70,7 @@ def extract_media_from_post(post: dict) -> List[dict]:
     post types (photo, video, audio) and returns a normalized list of media
     items with their metadata.
     
-    Args:if post_type == 'regular':
-            media_items.extend(_extract_regular(post, post_id))
-        el
+    Args:
         post: A Tumblr post dictionary from the API response
         
     Returns:
@@ -82,20 +96,15 @@ def extract_media_from_post(post: dict) -> List[dict]:
     
     media_items = []
     
+    extractor = _EXTRACTORS.get(post_type)
+    if extractor is None:
+        logger.debug("Unsupported post type '%s' for post %s", post_type, post_id)
+        return media_items
+    
     try:
-        if post_type == 'photo':
-            media_items.extend(_extract_photos(post, post_id))
-        elif post_type == 'video':
-            media_items.extend(_extract_videos(post, post_id))
-        elif post_type == 'audio':
-            media_items.extend(_extract_audio(post, post_id))
-        elif post_type == 'regular':
-            media_items.extend(_extract_regular(post, post_id))
-        else:
-            logger.debug(f"Unsupported post type '{post_type}' for post {post_id}")
-            
+        media_items.extend(extractor(post, post_id))
     except Exception as e:
-        logger.error(f"Error extracting media from post {post_id}: {e}", exc_info=True)
+        logger.error("Error extracting media from post %s: %s", post_id, e, exc_info=True)
     
     return media_items
 
@@ -156,7 +165,7 @@ def select_best_image(variants: List[dict]) -> dict:
             return 10000
         
         # Extract common Tumblr size patterns: _1280, _500, etc.
-        size_pattern = re.search(r'_(\d+)(?:\.|/|$)', url)
+        size_pattern = _URL_SIZE_RE.search(url)
         if size_pattern:
             return int(size_pattern.group(1))
         
@@ -177,8 +186,9 @@ def select_best_image(variants: List[dict]) -> dict:
     )
     
     best_variant = sorted_variants[0][1]
-    logger.debug(f"Selected image variant: {best_variant.get('url', 'unknown')} "
-                 f"({best_variant.get('width', 0)}×{best_variant.get('height', 0)})")
+    logger.debug("Selected image variant: %s (%s×%s)",
+                 best_variant.get('url', 'unknown'),
+                 best_variant.get('width', 0), best_variant.get('height', 0))
     
     return best_variant
 
@@ -201,23 +211,9 @@ def _extract_photos(post: dict, post_id: str) -> List[dict]:
     # Build variants from all photo-url-* fields
     variants = []
     
-    # Known photo URL fields in order of preference
-    photo_url_fields = [
-        'photo-url-1280',
-        'photo-url-500', 
-        'photo-url-400',
-        'photo-url-250',
-        'photo-url-100',
-        'photo-url-75'
-    ]
-    
-    for field in photo_url_fields:
+    for field, size in _PHOTO_URL_FIELDS:
         url = post.get(field)
         if url:
-            # Extract size from field name
-            size_match = re.search(r'photo-url-(\d+)', field)
-            size = int(size_match.group(1)) if size_match else 0
-            
             variants.append({
                 'url': url,
                 'width': size,  # Use size as width approximation
@@ -240,7 +236,7 @@ def _extract_photos(post: dict, post_id: str) -> List[dict]:
         # Determine if it's an animated GIF
         media_type = 'photo'
         url = best['url']
-        if url and url.lower().endswith('.gif'):
+        if url and url[-4:].lower() == '.gif':
             media_type = 'gif'
         
         media_items.append({
@@ -251,9 +247,9 @@ def _extract_photos(post: dict, post_id: str) -> List[dict]:
             'post_id': post_id
         })
         
-        logger.debug(f"Extracted photo from post {post_id}: {best['url']}")
+        logger.debug("Extracted photo from post %s: %s", post_id, best['url'])
     else:
-        logger.warning(f"No photo URLs found in photo post {post_id}")
+        logger.warning("No photo URLs found in photo post %s", post_id)
     
     return media_items
 
@@ -285,7 +281,7 @@ def _extract_videos(post: dict, post_id: str) -> List[dict]:
             if isinstance(player_item, dict):
                 embed_code = player_item.get('embed_code', '')
                 # Try to extract video URL from embed code
-                url_match = re.search(r'https?://[^\s"\'<>]+\.(?:mp4|mov|avi)', embed_code)
+                url_match = _VIDEO_URL_RE.search(embed_code)
                 if url_match:
                     video_url = url_match.group(0)
                     break
@@ -320,7 +316,7 @@ def _extract_videos(post: dict, post_id: str) -> List[dict]:
             'post_id': post_id
         })
     else:
-        logger.warning(f"No video URL found in video post {post_id}")
+        logger.warning("No video URL found in video post %s", post_id)
     
     return media_items
 
@@ -346,7 +342,7 @@ def _extract_audio(post: dict, post_id: str) -> List[dict]:
         player = post.get('player')
         if isinstance(player, str):
             # Try to extract audio URL from player HTML
-            url_match = re.search(r'https?://[^\s"\'<>]+\.(?:mp3|wav|m4a|ogg)', player)
+            url_match = _AUDIO_URL_RE.search(player)
             if url_match:
                 audio_url = url_match.group(0)
     
@@ -363,7 +359,7 @@ def _extract_audio(post: dict, post_id: str) -> List[dict]:
             'post_id': post_id
         })
     else:
-        logger.warning(f"No audio URL found in audio post {post_id}")
+        logger.warning("No audio URL found in audio post %s", post_id)
     
     return media_items
 
@@ -388,7 +384,7 @@ def _extract_regular(post: dict, post_id: str) -> List[dict]:
     # Get the HTML body content
     body = post.get('regular-body', '')
     if not body:
-        logger.debug(f"No regular-body found in regular post {post_id}")
+        logger.debug("No regular-body found in regular post %s", post_id)
         return media_items
     
     # Parse HTML to extract images
@@ -403,7 +399,7 @@ def _extract_regular(post: dict, post_id: str) -> List[dict]:
             
             # Determine media type
             media_type = 'photo'
-            if url.lower().endswith('.gif'):
+            if url[-4:].lower() == '.gif':
                 media_type = 'gif'
             
             media_items.append({
@@ -414,9 +410,18 @@ def _extract_regular(post: dict, post_id: str) -> List[dict]:
                 'post_id': post_id
             })
             
-            logger.debug(f"Extracted image from regular post {post_id}: {url}")
+            logger.debug("Extracted image from regular post %s: %s", post_id, url)
             
     except Exception as e:
-        logger.error(f"Error parsing HTML in regular post {post_id}: {e}")
+        logger.error("Error parsing HTML in regular post %s: %s", post_id, e)
     
     return media_items
+
+
+# Media extractor for each supported post type
+_EXTRACTORS = {
+    'photo': _extract_photos,
+    'video': _extract_videos,
+    'audio': _extract_audio,
+    'regular': _extract_regular,
+}
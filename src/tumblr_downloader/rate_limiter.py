@@ -7,7 +7,6 @@ usage of external services and avoid overwhelming servers.
 import asyncio
 import threading
 import time
-from typing import Optional
 
 
 class RateLimiter:
@@ -17,13 +16,24 @@ class RateLimiter:
     The bucket fills with tokens at a constant rate, and each operation
     consumes one token. If no tokens are available, the operation waits.
     
+    Waiting callers reserve their token up front: the balance may go
+    negative, and each caller sleeps exactly until its own token has been
+    earned. Callers are therefore served in arrival order, without holding
+    the lock while sleeping and without waking up to re-check the bucket.
+    
     Attributes:
         max_per_second: Maximum number of operations allowed per second.
-        tokens: Current number of available tokens.
+        tokens: Current token balance; negative while tokens are reserved.
         max_tokens: Maximum capacity of the token bucket.
         last_update: Timestamp of the last token refill.
     """
     
+    # Consulted by every download thread; slots keep attribute access cheap
+    __slots__ = (
+        'max_per_second', 'max_tokens', 'tokens', 'last_update',
+        '_lock',
+    )
+    
     def __init__(self, max_per_second: float):
         """Initialize the rate limiter.
         
@@ -42,7 +52,6 @@ class RateLimiter:
         self.tokens = max_per_second
         self.last_update = time.monotonic()
         self._lock = threading.Lock()
-        self._async_lock: Optional[asyncio.Lock] = None
     
     def _refill_tokens(self) -> None:
         """Refill tokens based on elapsed time.
@@ -57,57 +66,47 @@ class RateLimiter:
         self.tokens = min(self.max_tokens, self.tokens + new_tokens)
         self.last_update = now
     
+    def _reserve(self) -> float:
+        """Consume a token, borrowing against future refills if needed.
+        
+        Returns:
+            Seconds the caller must wait before its token is earned
+            (0.0 if one was available).
+        """
+        with self._lock:
+            self._refill_tokens()
+            self.tokens -= 1.0
+            
+            if self.tokens >= 0.0:
+                return 0.0
+            return -self.tokens / self.max_per_second
+    
     def wait(self) -> None:
         """Wait until a token is available (synchronous).
         
         This method blocks until a token becomes available, then consumes it.
         Safe to call from multiple threads.
         """
-        with self._lock:
-            while True:
-                self._refill_tokens()
-                
-                if self.tokens >= 1.0:
-                    self.tokens -= 1.0
-                    return
-                
-                # Calculate wait time for next token
-                tokens_needed = 1.0 - self.tokens
-                wait_time = tokens_needed / self.max_per_second
-                
-                # Release lock while sleeping to allow other threads
-                self._lock.release()
-                try:
-                    time.sleep(wait_time)
-                finally:
-                    self._lock.acquire()
+        wait_time = self._reserve()
+        if wait_time > 0.0:
+            time.sleep(wait_time)
     
     async def acquire(self) -> None:
         """Wait until a token is available (asynchronous).
         
         This method waits asynchronously until a token becomes available,
-        then consumes it. Safe to call from multiple coroutines.
+        then consumes it. Safe to call from multiple coroutines. If the
+        caller is cancelled while waiting, its reserved token is returned.
         """
-        # Initialize async lock on first use
-        if self._async_lock is None:
-            self._async_lock = asyncio.Lock()
-        
-        async with self._async_lock:
-            while True:
-                # Use synchronous lock for token state
+        wait_time = self._reserve()
+        if wait_time > 0.0:
+            try:
+                await asyncio.sleep(wait_time)
+            except asyncio.CancelledError:
                 with self._lock:
                     self._refill_tokens()
-                    
-                    if self.tokens >= 1.0:
-                        self.tokens -= 1.0
-                        return
-                    
-                    # Calculate wait time for next token
-                    tokens_needed = 1.0 - self.tokens
-                    wait_time = tokens_needed / self.max_per_second
-                
-                # Sleep asynchronously without holding lock
-                await asyncio.sleep(wait_time)
+                    self.tokens = min(self.max_tokens, self.tokens + 1.0)
+                raise
     
     def try_acquire(self) -> bool:
         """Try to acquire a token without waiting.
@@ -137,11 +136,12 @@ class RateLimiter:
         """Get the current number of available tokens.
         
         Returns:
-            The current number of tokens in the bucket.
+            The current number of tokens in the bucket (0.0 while tokens
+            are reserved by waiting callers).
         """
         with self._lock:
             self._refill_tokens()
-            return self.tokens
+            return max(0.0, self.tokens)
     
     def __repr__(self) -> str:
         """Return a string representation of the rate limiter."""
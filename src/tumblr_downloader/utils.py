@@ -10,7 +10,35 @@ import os
 import re
 from pathlib import Path
 from typing import Any, Union
-from urllib.parse import urlparse
+
+
+# Blog name from a URL in one pass: an optional scheme and www. prefix,
+# then either the subdomain before the first .tumblr.com or, for custom
+# domains, the full host up to the first path, query or fragment delimiter
+_BLOG_URL_RE = re.compile(
+    r'^(?:(?i:[a-z][a-z0-9+.-]*)://)?(?:www\.)?'
+    r'(?:(?P<subdomain>[^/?#]*?)\.tumblr\.com|(?P<host>[^/?#]*))'
+)
+
+# Characters invalid in Windows/Unix filenames: < > : " / \ | ? * and
+# control characters (0-31)
+_INVALID_FILENAME_CHARS_RE = re.compile(r'[<>:"/\\|?*\x00-\x1f]')
+
+# Reserved Windows device names, compared against the upper-cased stem
+_RESERVED_FILENAMES = frozenset({
+    'CON', 'PRN', 'AUX', 'NUL',
+    'COM1', 'COM2', 'COM3', 'COM4', 'COM5', 'COM6', 'COM7', 'COM8', 'COM9',
+    'LPT1', 'LPT2', 'LPT3', 'LPT4', 'LPT5', 'LPT6', 'LPT7', 'LPT8', 'LPT9'
+})
+
+# Post ID in a Tumblr post URL path: /post/123456789[/slug]
+_POST_PATH_ID_RE = re.compile(r'/post/(\d+)')
+
+# Fallback for extract_post_id(): first run of digits anywhere
+_DIGITS_RE = re.compile(r'\d+')
+
+# Units for format_bytes(); unit i covers sizes from 1024**i
+_BYTE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
 
 
 def sanitize_filename(filename: str) -> str:
@@ -30,20 +58,14 @@ def sanitize_filename(filename: str) -> str:
         raise ValueError("Filename cannot be empty")
     
     # Remove or replace invalid characters for Windows/Unix filesystems
-    # Invalid chars: < > : " / \ | ? * and control characters (0-31)
-    sanitized = re.sub(r'[<>:"/\\|?*\x00-\x1f]', '_', filename)
+    sanitized = _INVALID_FILENAME_CHARS_RE.sub('_', filename)
     
     # Remove leading/trailing spaces and dots (problematic on Windows)
     sanitized = sanitized.strip('. ')
     
     # Handle reserved Windows filenames
-    reserved_names = {
-        'CON', 'PRN', 'AUX', 'NUL',
-        'COM1', 'COM2', 'COM3', 'COM4', 'COM5', 'COM6', 'COM7', 'COM8', 'COM9',
-        'LPT1', 'LPT2', 'LPT3', 'LPT4', 'LPT5', 'LPT6', 'LPT7', 'LPT8', 'LPT9'
-    }
     name_without_ext = os.path.splitext(sanitized)[0].upper()
-    if name_without_ext in reserved_names:
+    if name_without_ext in _RESERVED_FILENAMES:
         sanitized = f"_{sanitized}"
     
     # Limit length to 255 chars (common filesystem limit)
@@ -84,23 +106,15 @@ def parse_blog_name(blog_input: str) -> str:
     
     # If it looks like a URL, parse it
     if '://' in blog_input or blog_input.startswith('www.'):
-        if not blog_input.startswith(('http://', 'https://')):
-            blog_input = 'https://' + blog_input
-        
-        parsed = urlparse(blog_input)
-        hostname = parsed.netloc or parsed.path.split('/')[0]
-        
-        # Extract the subdomain from tumblr.com URLs
-        if '.tumblr.com' in hostname:
-            blog_name = hostname.split('.tumblr.com')[0]
-            # Remove www. prefix if present
-            blog_name = blog_name.replace('www.', '')
-        else:
-            # For custom domains, use the full hostname without www
-            blog_name = hostname.replace('www.', '')
+        # Subdomain for tumblr.com URLs; custom domains use the full hostname
+        match = _BLOG_URL_RE.match(blog_input)
+        blog_name = match.group(match.lastgroup)
     else:
-        # Remove .tumblr.com suffix if present in plain text
-        blog_name = blog_input.replace('.tumblr.com', '')
+        # Remove .tumblr.com suffix if present in plain text (a tail
+        # comparison rather than a scan of the whole string)
+        blog_name = blog_input
+        if blog_name.endswith('.tumblr.com'):
+            blog_name = blog_name[:-len('.tumblr.com')]
     
     blog_name = blog_name.strip()
     
@@ -212,12 +226,12 @@ def extract_post_id(url_or_data: Any) -> str:
         
         # Try to extract from URL
         # Pattern: /post/123456789 or /post/123456789/some-slug
-        match = re.search(r'/post/(\d+)', url_or_data)
+        match = _POST_PATH_ID_RE.search(url_or_data)
         if match:
             return match.group(1)
         
         # Try to match just a number in the string
-        match = re.search(r'\d+', url_or_data)
+        match = _DIGITS_RE.search(url_or_data)
         if match:
             return match.group(0)
     
@@ -237,19 +251,11 @@ def format_bytes(bytes_count: int) -> str:
     if bytes_count < 0:
         raise ValueError("Byte count cannot be negative")
     
-    if bytes_count == 0:
-        return "0 B"
-    
-    units = ['B', 'KB', 'MB', 'GB', 'TB', 'PB']
-    unit_index = 0
-    size = float(bytes_count)
-    
-    while size >= 1024.0 and unit_index < len(units) - 1:
-        size /= 1024.0
-        unit_index += 1
+    # Each unit spans 10 bits, so the unit index follows from the bit length
+    unit_index = min((bytes_count.bit_length() - 1) // 10, len(_BYTE_UNITS) - 1)
     
     # Format with appropriate decimal places
-    if unit_index == 0:  # Bytes
-        return f"{int(size)} {units[unit_index]}"
-    else:
-        return f"{size:.2f} {units[unit_index]}"
+    if unit_index <= 0:  # Bytes (including zero)
+        return f"{bytes_count} B"
+    
+    return f"{bytes_count / (1 << (10 * unit_index)):.2f} {_BYTE_UNITS[unit_index]}"
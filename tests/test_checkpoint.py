@@ -0,0 +1,168 @@
+"""Tests for the resume checkpoint and how the CLI advances it."""
+
+import json
+import sys
+from datetime import datetime, timedelta
+
+import pytest
+
+from tumblr_downloader import cli
+from tumblr_downloader.api_client import TumblrAPIClient
+from tumblr_downloader.checkpoint import Checkpoint
+from tumblr_downloader.downloader import MediaDownloader
+
+
+def write_checkpoint(tmp_path, **fields):
+    data = {
+        'blog': 'myblog',
+        'offset': 150,
+        'timestamp': datetime.utcnow().isoformat(),
+    }
+    data.update(fields)
+    (tmp_path / Checkpoint.FILENAME).write_text(json.dumps(data), encoding='utf-8')
+
+
+def test_save_then_load_round_trips(tmp_path):
+    checkpoint = Checkpoint(tmp_path)
+    checkpoint.save('myblog', 150)
+    
+    assert checkpoint.load('myblog') == 150
+    assert not list(tmp_path.glob('.checkpoint_*'))
+
+
+def test_load_without_file_returns_none(tmp_path):
+    assert Checkpoint(tmp_path).load('myblog') is None
+
+
+def test_load_ignores_stale_checkpoint(tmp_path):
+    stale = datetime.utcnow() - Checkpoint.MAX_AGE - timedelta(minutes=1)
+    write_checkpoint(tmp_path, timestamp=stale.isoformat())
+    
+    assert Checkpoint(tmp_path).load('myblog') is None
+
+
+def test_load_ignores_other_blog(tmp_path):
+    write_checkpoint(tmp_path, blog='otherblog')
+    
+    assert Checkpoint(tmp_path).load('myblog') is None
+
+
+def test_load_treats_zero_offset_as_no_checkpoint(tmp_path):
+    write_checkpoint(tmp_path, offset=0)
+    
+    assert Checkpoint(tmp_path).load('myblog') is None
+
+
+@pytest.mark.parametrize('content', [
+    '{"blog": "myblog", "offset": 1',
+    '[1, 2, 3]',
+    '{"blog": "myblog", "offset": "abc", "timestamp": "2024-01-01T00:00:00"}',
+    '{"blog": "myblog", "offset": 50}',
+])
+def test_load_ignores_corrupt_checkpoint(tmp_path, content):
+    (tmp_path / Checkpoint.FILENAME).write_text(content, encoding='utf-8')
+    
+    assert Checkpoint(tmp_path).load('myblog') is None
+
+
+def test_clear_removes_checkpoint(tmp_path):
+    checkpoint = Checkpoint(tmp_path)
+    checkpoint.save('myblog', 150)
+    
+    checkpoint.clear()
+    
+    assert not (tmp_path / Checkpoint.FILENAME).exists()
+    assert checkpoint.load('myblog') is None
+
+
+def test_clear_without_checkpoint_is_noop(tmp_path):
+    Checkpoint(tmp_path).clear()
+
+
+def run_cli(monkeypatch, tmp_path, failing_posts=(), raising_posts=(), interrupt_at=None, extra_args=()):
+    """Run the CLI over mocked posts and return the posts it fetched.
+    
+    Downloads fail for failing_posts and raise for raising_posts; the run is
+    interrupted before post interrupt_at.
+    """
+    fetched = []
+    
+    def fake_get_posts(self, limit=None, start=0):
+        end = 500 if limit is None else min(500, start + limit)
+        for i in range(start, end):
+            if i == interrupt_at:
+                raise KeyboardInterrupt
+            fetched.append(i)
+            yield {'id': i, 'type': 'photo', 'photo-url-1280': f'https://media.example/{i}.jpg'}
+    
+    def fake_download_media(self, media_items):
+        if any(item['post_id'] in raising_posts for item in media_items):
+            raise RuntimeError('download pool broken')
+        return [
+            {
+                **item,
+                'success': item['post_id'] not in failing_posts,
+                'filename': f"{item['post_id']}.jpg",
+                'bytes_downloaded': 0,
+            }
+            for item in media_items
+        ]
+    
+    monkeypatch.setattr(TumblrAPIClient, 'get_posts', fake_get_posts)
+    monkeypatch.setattr(MediaDownloader, 'download_media', fake_download_media)
+    monkeypatch.setattr(sys, 'argv', [
+        'tumblr-media-downloader', '--blog', 'myblog', '--out', str(tmp_path), *extra_args
+    ])
+    
+    assert cli.main() == 0
+    return fetched
+
+
+def run_interrupted(monkeypatch, tmp_path, interrupt_at, **kwargs):
+    """Run the CLI, interrupting before post interrupt_at, and return the checkpoint offset."""
+    run_cli(monkeypatch, tmp_path, interrupt_at=interrupt_at, **kwargs)
+    return Checkpoint(tmp_path).load('myblog')
+
+
+def test_interrupted_run_resumes_after_last_completed_post(monkeypatch, tmp_path):
+    assert run_interrupted(monkeypatch, tmp_path, interrupt_at=110) == 110
+
+
+def test_interrupted_run_resumes_at_page_with_failed_download(monkeypatch, tmp_path):
+    page = TumblrAPIClient.POSTS_PER_PAGE
+    
+    offset = run_interrupted(monkeypatch, tmp_path, failing_posts={str(page + 10)}, interrupt_at=2 * page + 10)
+    
+    assert offset == page
+
+
+def test_interrupted_run_resumes_at_page_where_download_raised(monkeypatch, tmp_path):
+    page = TumblrAPIClient.POSTS_PER_PAGE
+    
+    offset = run_interrupted(monkeypatch, tmp_path, raising_posts={str(page + 10)}, interrupt_at=2 * page + 10)
+    
+    assert offset == page
+
+
+def test_interrupted_run_does_not_skip_failure_in_last_partial_page(monkeypatch, tmp_path):
+    page = TumblrAPIClient.POSTS_PER_PAGE
+    
+    offset = run_interrupted(monkeypatch, tmp_path, failing_posts={str(2 * page + 5)}, interrupt_at=2 * page + 10)
+    
+    assert offset == 2 * page
+
+
+def test_resumed_run_counts_checkpoint_towards_max_posts(monkeypatch, tmp_path):
+    assert run_interrupted(monkeypatch, tmp_path, interrupt_at=60, extra_args=['--max-posts', '100']) == 60
+    
+    fetched = run_cli(monkeypatch, tmp_path, extra_args=['--max-posts', '100'])
+    
+    assert fetched == list(range(60, 100))
+    assert Checkpoint(tmp_path).load('myblog') is None
+
+
+def test_resumed_run_past_max_posts_fetches_nothing(monkeypatch, tmp_path):
+    write_checkpoint(tmp_path, offset=150)
+    
+    assert run_cli(monkeypatch, tmp_path, extra_args=['--max-posts', '100']) == []
+    assert Checkpoint(tmp_path).load('myblog') is None
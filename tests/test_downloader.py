@@ -0,0 +1,167 @@
+"""Tests for the hand-off between workers downloading the same file."""
+
+import threading
+
+import pytest
+
+from tumblr_downloader.downloader import MediaDownloader
+
+URL = 'https://media.example/abc/tumblr_xyz_1280.jpg'
+
+
+@pytest.fixture
+def downloader(tmp_path):
+    downloader = MediaDownloader(output_dir=tmp_path, concurrency=4)
+    yield downloader
+    downloader.close()
+
+
+def item(n=0):
+    return {'url': URL, 'post_id': '1', 'n': n}
+
+
+def fetched(media_item, filename, bytes_downloaded=5):
+    return {
+        **media_item,
+        'success': True,
+        'filename': filename,
+        'bytes_downloaded': bytes_downloaded,
+    }
+
+
+def failed(media_item):
+    return {**media_item, 'success': False, 'error': 'HTTP 500', 'bytes_downloaded': 0}
+
+
+def run_in_thread(downloader, media_item, results):
+    thread = threading.Thread(
+        target=lambda: results.__setitem__(media_item['n'], downloader._download_single(media_item))
+    )
+    thread.start()
+    return thread
+
+
+def join(*threads):
+    for thread in threads:
+        thread.join(timeout=5)
+        assert not thread.is_alive(), "worker never finished"
+
+
+def test_duplicate_urls_in_a_post_download_once(downloader, monkeypatch):
+    calls = []
+    started = threading.Event()
+    release = threading.Event()
+    
+    def fake_fetch(media_item, url, filename, filepath):
+        calls.append(media_item['n'])
+        started.set()
+        release.wait(5)
+        return fetched(media_item, filename)
+    
+    monkeypatch.setattr(downloader, '_fetch_file', fake_fetch)
+    
+    results = {}
+    owner = run_in_thread(downloader, item(0), results)
+    started.wait(5)
+    waiters = [run_in_thread(downloader, item(n), results) for n in (1, 2)]
+    release.set()
+    join(owner, *waiters)
+    
+    assert calls == [0]
+    assert results[0]['success'] and not results[0].get('skipped')
+    assert all(results[n]['success'] and results[n]['skipped'] for n in (1, 2))
+
+
+def test_duplicate_urls_through_download_media(downloader, monkeypatch):
+    calls = []
+    
+    def fake_fetch(media_item, url, filename, filepath):
+        calls.append(media_item['n'])
+        return fetched(media_item, filename)
+    
+    monkeypatch.setattr(downloader, '_fetch_file', fake_fetch)
+    
+    results = downloader.download_media([item(n) for n in range(3)])
+    
+    assert len(calls) == 1
+    assert sorted(bool(result.get('skipped')) for result in results) == [False, True, True]
+    assert all(result['success'] for result in results)
+
+
+def test_waiter_takes_over_when_owner_fails(downloader, monkeypatch):
+    calls = []
+    started = threading.Event()
+    release = threading.Event()
+    
+    def fake_fetch(media_item, url, filename, filepath):
+        calls.append(media_item['n'])
+        if media_item['n'] == 0:
+            started.set()
+            release.wait(5)
+            return failed(media_item)
+        return fetched(media_item, filename)
+    
+    monkeypatch.setattr(downloader, '_fetch_file', fake_fetch)
+    
+    results = {}
+    owner = run_in_thread(downloader, item(0), results)
+    started.wait(5)
+    waiter = run_in_thread(downloader, item(1), results)
+    release.set()
+    join(owner, waiter)
+    
+    assert calls == [0, 1]
+    assert not results[0]['success']
+    assert results[1]['success'] and not results[1].get('skipped')
+
+
+def test_claim_is_released_when_fetch_raises(downloader, monkeypatch):
+    calls = []
+    started = threading.Event()
+    release = threading.Event()
+    
+    def fake_fetch(media_item, url, filename, filepath):
+        calls.append(media_item['n'])
+        if media_item['n'] == 0:
+            started.set()
+            release.wait(5)
+            raise RuntimeError('connection reset')
+        return fetched(media_item, filename)
+    
+    monkeypatch.setattr(downloader, '_fetch_file', fake_fetch)
+    
+    errors = []
+    
+    def run_owner():
+        try:
+            downloader._download_single(item(0))
+        except RuntimeError as e:
+            errors.append(e)
+    
+    owner = threading.Thread(target=run_owner)
+    owner.start()
+    started.wait(5)
+    results = {}
+    waiter = run_in_thread(downloader, item(1), results)
+    release.set()
+    join(owner, waiter)
+    
+    assert len(errors) == 1
+    assert calls == [0, 1]
+    assert results[1]['success'] and not results[1].get('skipped')
+    assert not downloader._in_progress
+
+
+def test_failed_download_is_retried_by_next_call(downloader, monkeypatch):
+    monkeypatch.setattr(downloader, '_fetch_file', lambda media_item, *args: failed(media_item))
+    
+    assert not downloader._download_single(item(0))['success']
+    assert not downloader._in_progress
+    
+    monkeypatch.setattr(
+        downloader, '_fetch_file',
+        lambda media_item, url, filename, filepath: fetched(media_item, filename)
+    )
+    
+    result = downloader._download_single(item(1))
+    assert result['success'] and not result.get('skipped')
@@ -0,0 +1,120 @@
+"""Tests for the manifest journal written between saves."""
+
+import json
+import os
+
+import pytest
+
+from tumblr_downloader import manifest as manifest_module
+from tumblr_downloader.manifest import ManifestWriter
+
+
+def add(writer, post_id, url='https://example.com/post'):
+    writer.add_post({'post_id': post_id, 'post_url': url}, [])
+
+
+def entry_line(post_id, url='https://example.com/post'):
+    return json.dumps({'post_id': post_id, 'post_url': url}) + '\n'
+
+
+def test_append_journal_is_replayed_on_load(tmp_path):
+    writer = ManifestWriter(tmp_path)
+    add(writer, '1')
+    add(writer, '2')
+    writer.append_journal()
+    
+    assert not (tmp_path / 'manifest.json').exists()
+    assert ManifestWriter(tmp_path).posts.keys() == {'1', '2'}
+
+
+def test_append_journal_writes_only_new_entries(tmp_path):
+    writer = ManifestWriter(tmp_path)
+    add(writer, '1')
+    writer.append_journal()
+    add(writer, '2')
+    writer.append_journal()
+    writer.append_journal()
+    
+    lines = (tmp_path / 'manifest.journal').read_text(encoding='utf-8').splitlines()
+    assert [json.loads(line)['post_id'] for line in lines] == ['1', '2']
+
+
+def test_journal_replays_over_manifest(tmp_path):
+    writer = ManifestWriter(tmp_path)
+    add(writer, '1', url='https://example.com/old')
+    add(writer, '2')
+    writer.save()
+    add(writer, '1', url='https://example.com/new')
+    add(writer, '3')
+    writer.append_journal()
+    
+    posts = ManifestWriter(tmp_path).posts
+    
+    assert posts.keys() == {'1', '2', '3'}
+    assert posts['1']['post_url'] == 'https://example.com/new'
+
+
+def test_save_removes_journal(tmp_path):
+    writer = ManifestWriter(tmp_path)
+    add(writer, '1')
+    writer.append_journal()
+    
+    writer.save()
+    
+    assert not (tmp_path / 'manifest.journal').exists()
+    assert ManifestWriter(tmp_path).posts.keys() == {'1'}
+
+
+def test_torn_last_line_is_dropped_and_truncated(tmp_path):
+    journal = tmp_path / 'manifest.journal'
+    journal.write_text(entry_line('1') + '{"post_id": "2", "post_u', encoding='utf-8')
+    
+    writer = ManifestWriter(tmp_path)
+    
+    assert writer.posts.keys() == {'1'}
+    assert journal.read_text(encoding='utf-8') == entry_line('1')
+    
+    add(writer, '3')
+    writer.append_journal()
+    assert ManifestWriter(tmp_path).posts.keys() == {'1', '3'}
+
+
+@pytest.mark.parametrize('line', [
+    'not json\n',
+    '[1, 2, 3]\n',
+    '"post"\n',
+    'null\n',
+    '{"post_url": "https://example.com/post"}\n',
+    '{"post_id": ""}\n',
+    '{"post_id": ["1"]}\n',
+])
+def test_invalid_journal_lines_are_skipped(tmp_path, line):
+    (tmp_path / 'manifest.journal').write_text(
+        entry_line('1') + line + entry_line('2'),
+        encoding='utf-8'
+    )
+    
+    assert ManifestWriter(tmp_path).posts.keys() == {'1', '2'}
+
+
+def test_complete_journal_is_not_opened_for_writing(tmp_path, monkeypatch):
+    (tmp_path / 'manifest.journal').write_text(entry_line('1'), encoding='utf-8')
+    
+    def fail_truncate(path, length):
+        raise AssertionError('journal should not be truncated')
+    
+    monkeypatch.setattr(manifest_module.os, 'truncate', fail_truncate)
+    
+    assert ManifestWriter(tmp_path).posts.keys() == {'1'}
+
+
+def test_torn_journal_loads_when_it_cannot_be_truncated(tmp_path, monkeypatch):
+    journal = tmp_path / 'manifest.journal'
+    journal.write_text(entry_line('1') + '{"post_id": "2"', encoding='utf-8')
+    
+    def read_only_truncate(path, length):
+        raise PermissionError(13, 'Permission denied', os.fspath(path))
+    
+    monkeypatch.setattr(manifest_module.os, 'truncate', read_only_truncate)
+    
+    assert ManifestWriter(tmp_path).posts.keys() == {'1'}
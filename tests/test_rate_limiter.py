@@ -0,0 +1,95 @@
+"""Tests for token reservation in the rate limiter."""
+
+import asyncio
+import threading
+import time
+
+from tumblr_downloader.rate_limiter import RateLimiter
+
+
+def drained(max_per_second):
+    limiter = RateLimiter(max_per_second=max_per_second)
+    while limiter.try_acquire():
+        pass
+    return limiter
+
+
+def test_waiting_callers_are_spaced_one_interval_apart():
+    limiter = drained(20.0)
+    finished = []
+    
+    def wait():
+        limiter.wait()
+        finished.append(time.monotonic())
+    
+    start = time.monotonic()
+    threads = [threading.Thread(target=wait) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    
+    # The n-th waiter's token is earned n intervals of 0.05s after start;
+    # sleeps never end early, but may end late on a busy machine
+    offsets = [done - start for done in sorted(finished)]
+    for n, offset in enumerate(offsets, 1):
+        assert offset >= 0.05 * n - 0.01, offsets
+    assert offsets[-1] < 5.0, offsets
+
+
+def test_reserved_tokens_make_balance_negative():
+    limiter = drained(10.0)
+    threads = [threading.Thread(target=limiter.wait) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    time.sleep(0.02)
+    
+    balance = limiter.tokens
+    available = limiter.get_available_tokens()
+    for thread in threads:
+        thread.join()
+    
+    assert balance < -2.0
+    assert available == 0.0
+
+
+def test_cancelled_acquire_returns_its_token():
+    async def cancel_while_waiting():
+        limiter = drained(10.0)
+        task = asyncio.ensure_future(limiter.acquire())
+        await asyncio.sleep(0.02)
+        reserved = limiter.tokens
+        
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+        else:
+            raise AssertionError("acquire() was not cancelled")
+        return reserved, limiter.tokens
+    
+    reserved, refunded = asyncio.run(cancel_while_waiting())
+    
+    assert reserved < -0.5
+    assert refunded >= 0.0
+
+
+def test_refund_does_not_overfill_bucket():
+    async def cancel_after_refill():
+        limiter = drained(10.0)
+        task = asyncio.ensure_future(limiter.acquire())
+        await asyncio.sleep(0.02)
+        
+        # Let the bucket refill completely before the waiter is cancelled
+        limiter.reset()
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+        return limiter
+    
+    limiter = asyncio.run(cancel_after_refill())
+    
+    assert limiter.tokens <= limiter.max_tokens